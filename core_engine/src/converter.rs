@@ -464,13 +464,14 @@ impl InputConverter for MasterFormatConverter {
 }
 
 pub fn convert_f32_to_i16(input: &[f32], output: &mut Vec<i16>) {
+    // `output` is a scratch buffer reused across chunks. Extending from the slice iterator
+    // sizes it once up front, so the loop body has no per-sample capacity check and can be
+    // vectorized.
     output.clear();
-    output.reserve(input.len());
-    for &sample in input {
+    output.extend(input.iter().map(|&sample| {
         let clamped = sample.clamp(-1.0, 1.0);
-        let scaled = (clamped * i16::MAX as f32).round();
-        output.push(scaled as i16);
-    }
+        (clamped * i16::MAX as f32).round() as i16
+    }));
 }
 
 #[cfg(test)]
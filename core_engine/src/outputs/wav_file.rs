@@ -15,6 +15,10 @@ use std::sync::Arc;
 use std::thread::{self, JoinHandle};
 use std::time::{Duration, Instant};
 
+// The default 8 KiB `BufWriter` flushes every ~20 ms of 48 kHz stereo f32 audio. A larger
+// buffer keeps the number of `write(2)` calls tied to capture duration, not mixed chunk count.
+const WAV_FILE_BUFFER_CAPACITY: usize = 256 * 1024;
+
 #[derive(Debug)]
 pub enum WavOutputError {
     UnsupportedSampleFormat(SampleFormat),
@@ -193,6 +197,7 @@ impl WavFileOutput {
                 let mut writer = hound::WavWriter::new(writer, spec)?;
                 let idle_sleep = Duration::from_micros(200);
                 let mut input_buffers = vec![VecDeque::<f32>::new(); consumers.len()];
+                let mut drain_buffer = Vec::<f32>::new();
                 let mut mixed_buffer = Vec::<f32>::new();
                 let mut converted_buffer = Vec::<f32>::new();
                 let mut quantized_buffer = Vec::<i16>::new();
@@ -202,15 +207,14 @@ impl WavFileOutput {
                     let mut drained_any = false;
                     for (consumer, buffer) in consumers.iter_mut().zip(input_buffers.iter_mut()) {
                         let drain_limit = consumer.occupied_len() / frame_channels * frame_channels;
-                        let mut drained = 0_usize;
-                        while drained < drain_limit {
-                            let Some(sample) = consumer.try_pop() else {
-                                break;
-                            };
-                            buffer.push_back(sample);
-                            drained_any = true;
-                            drained += 1;
+                        if drain_limit == 0 {
+                            continue;
                         }
+
+                        drain_buffer.resize(drain_limit, 0.0);
+                        let drained = consumer.pop_slice(&mut drain_buffer);
+                        buffer.extend(&drain_buffer[..drained]);
+                        drained_any |= drained > 0;
                     }
 
                     let ready_samples = input_buffers.iter().map(VecDeque::len).min().unwrap_or(0)
@@ -218,17 +222,20 @@ impl WavFileOutput {
                         * frame_channels;
 
                     if ready_samples > 0 {
+                        // Accumulate one input at a time over the whole ready span so the
+                        // inner loops are straight-line adds instead of a per-sample walk over
+                        // every input with a branch on each `pop_front`.
                         mixed_buffer.clear();
-                        mixed_buffer.reserve(ready_samples);
-
-                        for _ in 0..ready_samples {
-                            let mut mixed_sample = 0.0_f32;
-                            for input in &mut input_buffers {
-                                if let Some(sample) = input.pop_front() {
-                                    mixed_sample += sample;
-                                }
+                        mixed_buffer.resize(ready_samples, 0.0);
+                        for input in &mut input_buffers {
+                            for (mixed_sample, sample) in
+                                mixed_buffer.iter_mut().zip(input.drain(..ready_samples))
+                            {
+                                *mixed_sample += sample;
                             }
-                            mixed_buffer.push(mixed_sample * config.mix_gain);
+                        }
+                        for mixed_sample in &mut mixed_buffer {
+                            *mixed_sample *= config.mix_gain;
                         }
 
                         converter.convert(&mixed_buffer, &mut converted_buffer)?;
@@ -331,7 +338,7 @@ impl WavFileOutput {
         format: StreamFormat,
         consumer: RouteConsumer,
     ) -> Result<Self, WavOutputError> {
-        Self::spawn(BufWriter::new(file), format, consumer)
+        Self::spawn(buffered_file_writer(file), format, consumer)
     }
 
     pub fn try_spawn_file_mix_with_config(
@@ -339,7 +346,7 @@ impl WavFileOutput {
         consumers: Vec<RouteConsumer>,
         config: WavSinkConfig,
     ) -> Result<Self, (WavOutputError, Vec<RouteConsumer>)> {
-        Self::try_spawn_mix_with_config(BufWriter::new(file), consumers, config)
+        Self::try_spawn_mix_with_config(buffered_file_writer(file), consumers, config)
     }
 
     pub fn try_spawn_file_mix(
@@ -348,7 +355,7 @@ impl WavFileOutput {
         consumers: Vec<RouteConsumer>,
         mix_gain: f32,
     ) -> Result<Self, (WavOutputError, Vec<RouteConsumer>)> {
-        Self::try_spawn_mix(BufWriter::new(file), format, consumers, mix_gain)
+        Self::try_spawn_mix(buffered_file_writer(file), format, consumers, mix_gain)
     }
 
     pub fn spawn_file_mix_with_config(
@@ -356,7 +363,7 @@ impl WavFileOutput {
         consumers: Vec<RouteConsumer>,
         config: WavSinkConfig,
     ) -> Result<Self, WavOutputError> {
-        Self::spawn_mix_with_config(BufWriter::new(file), consumers, config)
+        Self::spawn_mix_with_config(buffered_file_writer(file), consumers, config)
     }
 
     pub fn spawn_file_mix(
@@ -365,7 +372,7 @@ impl WavFileOutput {
         consumers: Vec<RouteConsumer>,
         mix_gain: f32,
     ) -> Result<Self, WavOutputError> {
-        Self::spawn_mix(BufWriter::new(file), format, consumers, mix_gain)
+        Self::spawn_mix(buffered_file_writer(file), format, consumers, mix_gain)
     }
 
     pub fn spawn_path<P: AsRef<Path>>(
@@ -462,10 +469,14 @@ where
             }
         }
         SampleFormat::I16 => {
+            // Encode the whole chunk into hound's reusable buffer and hand it to the
+            // underlying writer in one `write_all`; the RIFF header is only patched on finalize.
             convert_f32_to_i16(samples, quantized);
-            for sample in quantized {
-                writer.write_sample(*sample)?;
+            let mut sample_writer = writer.get_i16_writer(quantized.len() as u32);
+            for sample in quantized.iter() {
+                sample_writer.write_sample(*sample);
             }
+            sample_writer.flush()?;
         }
     }
 
@@ -483,6 +494,10 @@ where
     Ok(())
 }
 
+fn buffered_file_writer(file: File) -> BufWriter<File> {
+    BufWriter::with_capacity(WAV_FILE_BUFFER_CAPACITY, file)
+}
+
 fn duration_to_u32_us(duration: Duration) -> u32 {
     duration.as_micros().min(u32::MAX as u128) as u32
 }
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import time
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
 try:
     import macloop
 except ModuleNotFoundError:
@@ -14,6 +14,8 @@ except ModuleNotFoundError:
     bootstrap_repo_root()
     import macloop
 
+DECODE_WINDOW_MS = 320
+
 
 def download_sherpa_model(repo_id: str, cache_dir: Optional[str] = None) -> Path:
     try:
@@ -33,11 +35,17 @@ def download_sherpa_model(repo_id: str, cache_dir: Optional[str] = None) -> Path
     return Path(local_dir)
 
 
+@functools.lru_cache(maxsize=None)
+def list_model_dir(model_dir: Path) -> tuple[Path, ...]:
+    return tuple(sorted(model_dir.iterdir()))
+
+
 def find_file(model_dir: Path, patterns: list[str], required: bool = True) -> Optional[Path]:
+    entries = list_model_dir(model_dir)
     for pattern in patterns:
-        matches = sorted(model_dir.glob(pattern))
-        if matches:
-            return matches[0]
+        for path in entries:
+            if path.match(pattern):
+                return path
     if required:
         joined = ", ".join(patterns)
         raise FileNotFoundError(f"No file matched patterns: {joined} in {model_dir}")
@@ -48,7 +56,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Minimal macloop + sherpa-onnx microphone ASR demo.")
     parser.add_argument("--seconds", type=float, default=5.0, help="How long to capture from microphone.")
     parser.add_argument("--sample-rate", type=int, default=16_000, help="Output sample rate.")
-    parser.add_argument("--chunk-frames", type=int, default=320, help="Frames per ASR chunk.")
+    parser.add_argument(
+        "--chunk-frames",
+        type=int,
+        default=None,
+        help="Frames per ASR chunk. Defaults to 320 ms of audio, the streaming Zipformer decode window.",
+    )
     parser.add_argument("--device-id", type=int, default=None, help="Optional microphone device id.")
     parser.add_argument(
         "--repo-id",
@@ -58,6 +71,9 @@ def main() -> None:
     parser.add_argument("--model-dir", default=None, help="Local sherpa model directory. If omitted, downloads from HF.")
     parser.add_argument("--hf-cache-dir", default=None, help="Optional Hugging Face cache directory.")
     args = parser.parse_args()
+    # Let the sink accumulate a whole decode window in Rust so sherpa runs one decode per chunk
+    # instead of being fed (and polled) every 20 ms.
+    chunk_frames = args.chunk_frames or args.sample_rate * DECODE_WINDOW_MS // 1000
 
     try:
         import sherpa_onnx
@@ -110,13 +126,14 @@ def main() -> None:
 
         with macloop.AsrSink(
             routes=[mic_for_asr],
-            chunk_frames=args.chunk_frames,
+            chunk_frames=chunk_frames,
             sample_rate=args.sample_rate,
             channels=1,
             sample_format="f32",
         ) as asr_sink:
             for chunk in asr_sink.chunks():
-                samples = np.asarray(chunk.samples, dtype=np.float32)
+                # The sink already emits float32 arrays, so feed them to sherpa as-is.
+                samples = chunk.samples
                 if samples.size == 0:
                     continue
 
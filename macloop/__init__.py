@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import os
-import queue
+import threading
+import time
 import uuid
 import warnings
 import weakref
-from dataclasses import dataclass
+from collections import deque
 from pathlib import Path
-from typing import Any, AsyncIterator, Iterator, Optional, Protocol, Sequence, Tuple, Type, Union
+from typing import Any, AsyncIterator, Callable, Iterator, NamedTuple, Optional, Protocol, Sequence, Tuple, Type, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -38,32 +39,109 @@ _STOP = object()
 _WAV_DEFAULT_SAMPLE_RATE = 48_000
 _WAV_DEFAULT_CHANNELS = 2
 _WAV_DEFAULT_SAMPLE_FORMAT = "f32"
+_SOURCE_LIST_TTL_S = 2.0
+_SOURCE_LIST_CACHE: dict[str, tuple[float, tuple[dict[str, Any], ...]]] = {}
 
 
 def _generate_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex}"
 
 
-def _drop_oldest_put(q: "queue.Queue[object]", item: object) -> None:
-    try:
-        q.put_nowait(item)
-    except queue.Full:
+class _ChunkRing:
+    def __init__(self, maxsize: int) -> None:
+        self._items: "deque[object]" = deque(maxlen=maxsize if maxsize > 0 else None)
+        self._ready = threading.Event()
+
+    def put(self, item: object) -> None:
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self) -> object:
+        items = self._items
+        while True:
+            if items:
+                return items.popleft()
+            # Recheck after clearing so a put racing with clear() is not slept through.
+            self._ready.clear()
+            if items:
+                continue
+            self._ready.wait()
+
+    def drain(self) -> list[object]:
+        items = self._items
+        drained = []
+        while items:
+            drained.append(items.popleft())
+        return drained
+
+
+class _LoopWakeup:
+    def __init__(self, loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
         try:
-            q.get_nowait()
-        except queue.Empty:
+            loop.add_reader(self._read_fd, callback)
+        except BaseException:
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+            raise
+
+    def notify(self) -> None:
+        # Serialised with close() so a producer never writes to a closed (or reused) fd.
+        with self._lock:
+            if self._write_fd < 0:
+                return
+            try:
+                os.write(self._write_fd, b"\x01")
+            except BlockingIOError:
+                pass
+
+    def consume(self) -> None:
+        if self._read_fd < 0:
+            return
+        try:
+            os.read(self._read_fd, 4096)
+        except BlockingIOError:
             pass
-        q.put_nowait(item)
 
+    def close(self) -> None:
+        with self._lock:
+            if self._write_fd < 0:
+                return
+            if not self._loop.is_closed():
+                self._loop.remove_reader(self._read_fd)
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+            self._read_fd = self._write_fd = -1
 
-def _drop_oldest_put_async(q: "asyncio.Queue[object]", item: object) -> None:
+
+def _is_running_loop(loop: asyncio.AbstractEventLoop) -> bool:
     try:
-        q.put_nowait(item)
-    except asyncio.QueueFull:
-        try:
-            q.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
-        q.put_nowait(item)
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def _drop_oldest_put_async(q: "asyncio.Queue[object]", item: object) -> None:
+    if q.full():
+        q.get_nowait()
+    q.put_nowait(item)
+
+
+def _cached_source_list(
+    kind: str, fetch: Callable[[], Sequence[dict[str, Any]]], *, refresh: bool
+) -> list[dict[str, Any]]:
+    now = time.monotonic()
+    cached = _SOURCE_LIST_CACHE.get(kind)
+    if not refresh and cached is not None and now < cached[0]:
+        entries = cached[1]
+    else:
+        entries = tuple(fetch())
+        _SOURCE_LIST_CACHE[kind] = (now + _SOURCE_LIST_TTL_S, entries)
+    return [dict(entry) for entry in entries]
 
 
 def _raise_on_unexpected_kwargs(name: str, kwargs: dict[str, Any]) -> None:
@@ -100,8 +178,7 @@ def _close_backend_with_optional_engine(backend: Any, engine_backend: Any | None
         backend.close()
 
 
-@dataclass(frozen=True, slots=True)
-class AudioChunk:
+class AudioChunk(NamedTuple):
     route_id: str
     frames: int
     samples: AudioSamples
@@ -131,8 +208,8 @@ class MicrophoneSource:
         self.vpio_enabled = vpio_enabled
 
     @staticmethod
-    def list_devices() -> list[dict[str, Any]]:
-        return list(_list_microphones())
+    def list_devices(*, refresh: bool = False) -> list[dict[str, Any]]:
+        return _cached_source_list("microphones", _list_microphones, refresh=refresh)
 
     @classmethod
     def _resolve_backend_spec_kwargs(
@@ -158,8 +235,8 @@ class SystemAudioSource:
         self.display_id = display_id
 
     @staticmethod
-    def list_displays() -> list[dict[str, Any]]:
-        return list(_list_displays())
+    def list_displays(*, refresh: bool = False) -> list[dict[str, Any]]:
+        return _cached_source_list("displays", _list_displays, refresh=refresh)
 
     @classmethod
     def _resolve_backend_spec_kwargs(
@@ -170,7 +247,7 @@ class SystemAudioSource:
     ) -> tuple[str, dict[str, Any]]:
         _raise_on_unexpected_kwargs("SystemAudioSource", kwargs)
         if display_id is None:
-            displays = cls.list_displays()
+            displays = cls.list_displays(refresh=True)
             if not displays:
                 raise RuntimeError("no displays are available for system audio capture")
             display_id = int(displays[0]["id"])
@@ -191,8 +268,8 @@ class AppAudioSource:
         self.display_id = display_id
 
     @staticmethod
-    def list_applications() -> list[dict[str, Any]]:
-        return list(_list_applications())
+    def list_applications(*, refresh: bool = False) -> list[dict[str, Any]]:
+        return _cached_source_list("applications", _list_applications, refresh=refresh)
 
     @classmethod
     def _resolve_backend_spec_kwargs(
@@ -489,7 +566,7 @@ class AsrSink:
 
         sink_id = id or _generate_id("asr_sink")
         route_ids = [route.id for route in routes]
-        out_queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        out_queue = _ChunkRing(max_queue_size)
 
         self.id = sink_id
         self._engine_ref = weakref.ref(engine)
@@ -498,12 +575,11 @@ class AsrSink:
         self._queue_maxsize = max_queue_size
         self._async_queue: Optional[asyncio.Queue[object]] = None
         self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wakeup: Optional[_LoopWakeup] = None
+        self._async_drain_pending = False
         self._consume_mode: Optional[str] = None
         self._closed = False
 
-        def _callback(route_id: str, frames: int, samples: AudioSamples) -> None:
-            self._enqueue_chunk(AudioChunk(route_id=route_id, frames=frames, samples=samples))
-
         backend = _create_asr_sink(
             engine._backend,
             sink_id,
@@ -512,7 +588,7 @@ class AsrSink:
             channels,
             sample_format,
             chunk_frames,
-            _callback,
+            self._on_chunk,
         )
 
         self._backend = backend
@@ -538,6 +614,8 @@ class AsrSink:
 
     def close(self) -> None:
         if self._closed:
+            if self._async_loop is not None and self._async_loop.is_closed():
+                self._close_async_wakeup()
             return
 
         err: Optional[Exception] = None
@@ -553,11 +631,15 @@ class AsrSink:
             self._closed = True
             if engine is not None:
                 engine._release_routes(self._route_ids)
-            _drop_oldest_put(self._queue, _STOP)
+            self._queue.put(_STOP)
             async_loop = self._async_loop
-            async_queue = self._async_queue
-            if async_loop is not None and async_queue is not None:
-                async_loop.call_soon_threadsafe(_drop_oldest_put_async, async_queue, _STOP)
+            if async_loop is not None:
+                if async_loop.is_closed():
+                    self._close_async_wakeup()
+                elif _is_running_loop(async_loop) or not async_loop.is_running():
+                    self._drain_sync_queue_into_async()
+                else:
+                    self._schedule_async_drain()
 
         if err is not None:
             raise err
@@ -583,13 +665,25 @@ class AsrSink:
         except Exception:
             pass
 
-    def _enqueue_chunk(self, chunk: AudioChunk) -> None:
-        async_loop = self._async_loop
-        async_queue = self._async_queue
-        if async_loop is not None and async_queue is not None:
-            async_loop.call_soon_threadsafe(_drop_oldest_put_async, async_queue, chunk)
+    def _on_chunk(self, route_id: str, frames: int, samples: AudioSamples) -> None:
+        if self._closed:
+            return
+        self._queue.put(AudioChunk(route_id, frames, samples))
+        if self._async_loop is not None:
+            self._schedule_async_drain()
+
+    def _schedule_async_drain(self) -> None:
+        wakeup = self._async_wakeup
+        if wakeup is None or self._async_drain_pending:
             return
-        _drop_oldest_put(self._queue, chunk)
+        self._async_drain_pending = True
+        wakeup.notify()
+
+    def _close_async_wakeup(self) -> None:
+        wakeup = self._async_wakeup
+        if wakeup is not None:
+            self._async_wakeup = None
+            wakeup.close()
 
     def _activate_sync_mode(self) -> None:
         if self._consume_mode is None:
@@ -607,8 +701,9 @@ class AsrSink:
             raise RuntimeError("asr sink is already being consumed synchronously")
 
         if self._async_queue is None:
-            self._async_loop = loop
+            self._async_wakeup = _LoopWakeup(loop, self._drain_sync_queue_into_async)
             self._async_queue = asyncio.Queue(maxsize=self._queue_maxsize)
+            self._async_loop = loop
             self._drain_sync_queue_into_async()
         elif self._async_loop is not loop:
             raise RuntimeError("asr sink asyncio consumer is bound to a different event loop")
@@ -616,15 +711,19 @@ class AsrSink:
         return self._async_queue
 
     def _drain_sync_queue_into_async(self) -> None:
+        wakeup = self._async_wakeup
+        if wakeup is not None:
+            wakeup.consume()
+        self._async_drain_pending = False
         if self._async_queue is None:
             return
 
-        while True:
-            try:
-                item = self._queue.get_nowait()
-            except queue.Empty:
-                return
+        stopped = False
+        for item in self._queue.drain():
             _drop_oldest_put_async(self._async_queue, item)
+            stopped = stopped or item is _STOP
+        if stopped:
+            self._close_async_wakeup()
 
 
 class WavSink:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, AsyncIterator, Iterator, Literal, Optional, Sequence, Union, overload
+from typing import Any, AsyncIterator, Iterator, Literal, NamedTuple, Optional, Sequence, Union, overload
 
 import numpy as np
 import numpy.typing as npt
@@ -17,7 +17,7 @@ from ._macloop import (
 AudioSamples = Union[npt.NDArray[np.int16], npt.NDArray[np.float32]]
 
 
-class AudioChunk:
+class AudioChunk(NamedTuple):
     route_id: str
     frames: int
     samples: AudioSamples
@@ -35,7 +35,7 @@ class MicrophoneSource:
         vpio_enabled: bool = True,
     ) -> None: ...
     @staticmethod
-    def list_devices() -> list[dict[str, Any]]: ...
+    def list_devices(*, refresh: bool = False) -> list[dict[str, Any]]: ...
 
 
 class SystemAudioSource:
@@ -43,7 +43,7 @@ class SystemAudioSource:
     display_id: Optional[int]
     def __init__(self, id: Optional[str] = None, *, display_id: Optional[int] = None) -> None: ...
     @staticmethod
-    def list_displays() -> list[dict[str, Any]]: ...
+    def list_displays(*, refresh: bool = False) -> list[dict[str, Any]]: ...
 
 
 class AppAudioSource:
@@ -58,7 +58,7 @@ class AppAudioSource:
         display_id: Optional[int] = None,
     ) -> None: ...
     @staticmethod
-    def list_applications() -> list[dict[str, Any]]: ...
+    def list_applications(*, refresh: bool = False) -> list[dict[str, Any]]: ...
 
 
 class SyntheticSource:
@@ -10,15 +10,15 @@ use core_engine::{
     SystemAudioSource, SystemAudioSourceConfig, WavFileOutput, WavSinkConfig,
     WavSinkMetricsSnapshot,
 };
-use numpy::ToPyArray;
+use numpy::IntoPyArray;
 use pyo3::exceptions::{PyOSError, PyRuntimeError, PyTimeoutError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyDict, PyList, PyModule};
+use pyo3::types::{PyAny, PyDict, PyList, PyModule, PyString};
 use stats::{
     PyAsrInputStats, PyLatencyStats, PyPipelineStats, PyProcessorStats, PyStreamStats,
     PyWavSinkStats,
 };
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::fs::File;
 use std::os::fd::FromRawFd;
 use std::os::raw::c_int;
@@ -916,17 +916,18 @@ type DetachedAsrStartResult = Result<AsrSink, (String, Vec<(String, RouteConsume
 type DetachedWavStartResult = Result<WavFileOutput, (String, Vec<(String, RouteConsumer)>)>;
 
 const ASR_WORKER_QUEUE_CAPACITY: usize = 32;
+const ASR_WORKER_MAX_BATCH: usize = 8;
 const ASR_WORKER_JOIN_TIMEOUT: Duration = Duration::from_millis(500);
 const ASR_WORKER_JOIN_POLL: Duration = Duration::from_millis(5);
 
 enum AsrWorkerPayload {
     F32 {
-        input_id: String,
+        input_id: Arc<str>,
         frames: usize,
         samples: Vec<f32>,
     },
     I16 {
-        input_id: String,
+        input_id: Arc<str>,
         frames: usize,
         samples: Vec<i16>,
     },
@@ -936,6 +937,9 @@ struct PythonAsrCallback {
     tx: Option<mpsc::SyncSender<AsrWorkerPayload>>,
     worker: Option<JoinHandle<()>>,
     dropped_chunks: Arc<AtomicU64>,
+    // Route ids are interned once per sink so the sink thread hands the worker a shared
+    // `Arc<str>` instead of allocating a fresh `String` for every chunk.
+    input_ids: HashSet<Arc<str>>,
 }
 
 impl PythonAsrCallback {
@@ -945,25 +949,54 @@ impl PythonAsrCallback {
             // `callback` is owned by this thread. Its final drop happens when this closure
             // returns; PyO3 queues the decref and the next GIL holder releases it, so no
             // extra Python attach is required here.
+            //
+            // Chunks that are already queued are drained together so a burst pays for one
+            // Python attach instead of one per chunk. We never wait for more chunks to arrive.
+            let mut batch = Vec::with_capacity(ASR_WORKER_MAX_BATCH);
+            let mut py_input_ids: HashMap<Arc<str>, Py<PyString>> = HashMap::new();
             while let Ok(payload) = rx.recv() {
+                batch.push(payload);
+                while batch.len() < ASR_WORKER_MAX_BATCH {
+                    match rx.try_recv() {
+                        Ok(payload) => batch.push(payload),
+                        Err(_) => break,
+                    }
+                }
+
                 let _ = Python::try_attach(|py| {
-                    let (input_id, frames, samples_obj) = match payload {
-                        AsrWorkerPayload::F32 {
-                            input_id,
-                            frames,
-                            samples,
-                        } => (input_id, frames, samples.to_pyarray(py).into_any().unbind()),
-                        AsrWorkerPayload::I16 {
-                            input_id,
-                            frames,
-                            samples,
-                        } => (input_id, frames, samples.to_pyarray(py).into_any().unbind()),
-                    };
-
-                    if let Err(err) = callback.call1(py, (input_id, frames, samples_obj)) {
-                        err.print(py);
+                    for payload in batch.drain(..) {
+                        let (input_id, frames, samples_obj) = match payload {
+                            AsrWorkerPayload::F32 {
+                                input_id,
+                                frames,
+                                samples,
+                            } => (
+                                input_id,
+                                frames,
+                                samples.into_pyarray(py).into_any().unbind(),
+                            ),
+                            AsrWorkerPayload::I16 {
+                                input_id,
+                                frames,
+                                samples,
+                            } => (
+                                input_id,
+                                frames,
+                                samples.into_pyarray(py).into_any().unbind(),
+                            ),
+                        };
+
+                        let py_input_id = py_input_ids
+                            .entry(input_id)
+                            .or_insert_with_key(|input_id| PyString::new(py, input_id).unbind())
+                            .clone_ref(py);
+
+                        if let Err(err) = callback.call1(py, (py_input_id, frames, samples_obj)) {
+                            err.print(py);
+                        }
                     }
                 });
+                batch.clear();
             }
         });
 
@@ -971,6 +1004,7 @@ impl PythonAsrCallback {
             tx: Some(tx),
             worker: Some(worker),
             dropped_chunks: Arc::new(AtomicU64::new(0)),
+            input_ids: HashSet::new(),
         }
     }
 }
@@ -985,14 +1019,23 @@ impl AsrSinkCallback for PythonAsrCallback {
             return;
         };
 
+        let input_id = match self.input_ids.get(chunk.input_id) {
+            Some(input_id) => input_id.clone(),
+            None => {
+                let input_id: Arc<str> = Arc::from(chunk.input_id);
+                self.input_ids.insert(input_id.clone());
+                input_id
+            }
+        };
+
         let payload = match chunk.samples {
             AsrSampleSlice::F32(values) => AsrWorkerPayload::F32 {
-                input_id: chunk.input_id.to_string(),
+                input_id,
                 frames: chunk.frames,
                 samples: values.to_vec(),
             },
             AsrSampleSlice::I16(values) => AsrWorkerPayload::I16 {
-                input_id: chunk.input_id.to_string(),
+                input_id,
                 frames: chunk.frames,
                 samples: values.to_vec(),
             },
@@ -1011,7 +1054,7 @@ impl AsrSinkCallback for PythonAsrCallback {
 impl Drop for PythonAsrCallback {
     fn drop(&mut self) {
         // Drop the sender first so the worker's `rx.recv()` returns `Err(Disconnected)` and
-        // the loop can exit naturally once it finishes the chunk it is currently handling.
+        // the loop can exit naturally once it finishes the batch it is currently handling.
         drop(self.tx.take());
 
         let Some(handle) = self.worker.take() else {
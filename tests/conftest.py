@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib
 import os
 import sys
+import threading
+import time
 import types
 
 import numpy as np
@@ -119,11 +121,26 @@ class _FakeAsrSinkBackend:
     def __init__(self) -> None:
         self.closed = False
         self._stats = {}
+        self.emitted = threading.Event()
+        self._emitter: threading.Thread | None = None
+
+    def start(self, callback, chunks) -> None:
+        # Like the native sink, deliver chunks from a separate thread after creation returns.
+        self._emitter = threading.Thread(target=self._emit, args=(callback, chunks), daemon=True)
+        self._emitter.start()
+
+    def _emit(self, callback, chunks) -> None:
+        time.sleep(0.01)
+        for chunk in chunks:
+            callback(*chunk)
+        self.emitted.set()
 
     def stats(self):
         return self._stats
 
     def close(self) -> None:
+        if self._emitter is not None:
+            self._emitter.join(timeout=1.0)
         self.closed = True
 
 
@@ -271,8 +288,13 @@ def _fake_create_asr_sink(
             callback=callback_latency,
         )
     }
-    callback(route_ids[0], chunk_frames, np.array([0.1, 0.2], dtype=np.float32))
-    callback(route_ids[0], chunk_frames, np.array([0.3, 0.4], dtype=np.float32))
+    backend.start(
+        callback,
+        [
+            (route_ids[0], chunk_frames, np.array([0.1, 0.2], dtype=np.float32)),
+            (route_ids[0], chunk_frames, np.array([0.3, 0.4], dtype=np.float32)),
+        ],
+    )
     return backend
 
 
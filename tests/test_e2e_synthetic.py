@@ -305,6 +305,51 @@ def test_synthetic_source_reaches_resampled_asr_output() -> None:
     assert np.allclose(chunk.samples, np.full(320, 0.5, dtype=np.float32), atol=1e-3)
 
 
+def test_asr_sink_only_receives_chunks_for_its_own_routes(tmp_path: Path) -> None:
+    with macloop.AudioEngine() as engine:
+        mic_like = engine.create_stream(
+            macloop.SyntheticSource,
+            "synthetic_mic_like",
+            frames_per_callback=4,
+            callback_count=6,
+            start_value=1.0,
+            step_value=0.0,
+            start_delay_ms=100,
+        )
+        system_like = engine.create_stream(
+            macloop.SyntheticSource,
+            "synthetic_system_like",
+            frames_per_callback=4,
+            callback_count=6,
+            start_value=3.0,
+            step_value=0.0,
+            start_delay_ms=100,
+        )
+
+        asr_route = engine.route("synthetic_mic_for_asr", stream=mic_like)
+        wav_route = engine.route("synthetic_system_for_wav", stream=system_like)
+
+        asr_sink = macloop.AsrSink(
+            routes=[asr_route],
+            chunk_frames=4,
+            sample_rate=48_000,
+            channels=1,
+            sample_format="f32",
+        )
+        wav_sink = macloop.WavSink(route=wav_route, file=tmp_path / "system_like.wav")
+
+        chunks = _collect_chunks(asr_sink, 3)
+
+        asr_sink.close()
+        wav_sink.close()
+
+    # The engine only feeds routes claimed by the sink, so the consumer never has to
+    # filter out chunks from other streams.
+    assert [chunk.route_id for chunk in chunks] == ["synthetic_mic_for_asr"] * 3
+    for chunk in chunks:
+        assert np.array_equal(chunk.samples, np.ones(4, dtype=np.float32))
+
+
 def test_two_synthetic_sources_mix_into_aligned_wav(tmp_path: Path) -> None:
     output_path = tmp_path / "synthetic_mix.wav"
 
@@ -223,6 +223,7 @@ def test_asr_sink_yields_chunks_and_claims_routes(macloop_module) -> None:
                 sample_format="f32",
             )
 
+        assert sink._backend.emitted.wait(timeout=1.0)
         chunk = next(sink.chunks())
         assert chunk.route_id == route.id
         assert chunk.frames == 2
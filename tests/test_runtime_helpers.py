@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import gc
 import os
-import queue
+import threading
 
 import numpy as np
 import pytest
@@ -29,12 +29,13 @@ def test_generate_id_and_unexpected_kwargs_helpers(macloop_module) -> None:
 
 
 def test_drop_oldest_put_helpers(macloop_module) -> None:
-    q: "queue.Queue[object]" = queue.Queue(maxsize=2)
-    macloop_module._drop_oldest_put(q, "first")
-    macloop_module._drop_oldest_put(q, "second")
-    macloop_module._drop_oldest_put(q, "third")
-    assert q.get_nowait() == "second"
-    assert q.get_nowait() == "third"
+    ring = macloop_module._ChunkRing(2)
+    ring.put("first")
+    ring.put("second")
+    ring.put("third")
+    assert ring.get() == "second"
+    assert ring.get() == "third"
+    assert ring.drain() == []
 
     async def exercise_async() -> list[object]:
         q_async: "asyncio.Queue[object]" = asyncio.Queue(maxsize=2)
@@ -46,6 +47,21 @@ def test_drop_oldest_put_helpers(macloop_module) -> None:
     assert asyncio.run(exercise_async()) == ["second", "third"]
 
 
+def test_chunk_ring_wakes_blocked_consumer(macloop_module) -> None:
+    ring = macloop_module._ChunkRing(0)
+    received: list[object] = []
+    consumer = threading.Thread(target=lambda: received.extend([ring.get(), ring.get()]))
+    consumer.start()
+
+    for item in range(5):
+        ring.put(item)
+
+    consumer.join(timeout=2.0)
+    assert not consumer.is_alive()
+    assert received == [0, 1]
+    assert ring.drain() == [2, 3, 4]
+
+
 def test_microphone_source_list_devices_passthrough(macloop_module) -> None:
     microphones = macloop_module.MicrophoneSource.list_devices()
     assert microphones == [
@@ -54,6 +70,38 @@ def test_microphone_source_list_devices_passthrough(macloop_module) -> None:
     ]
 
 
+def test_source_listings_are_cached_until_refreshed(macloop_module, monkeypatch) -> None:
+    applications = [{"pid": 1, "name": "Zoom", "bundle_id": "us.zoom.xos"}]
+    calls = []
+
+    def list_applications():
+        calls.append("applications")
+        return [dict(app) for app in applications]
+
+    monkeypatch.setattr(macloop_module, "_list_applications", list_applications)
+
+    first = macloop_module.AppAudioSource.list_applications()
+    first[0]["pid"] = 999
+    applications.append({"pid": 2, "name": "Music", "bundle_id": "com.apple.Music"})
+    assert [app["pid"] for app in macloop_module.AppAudioSource.list_applications()] == [1]
+    assert calls == ["applications"]
+
+    refreshed = macloop_module.AppAudioSource.list_applications(refresh=True)
+    assert [app["pid"] for app in refreshed] == [1, 2]
+    assert calls == ["applications", "applications"]
+
+
+def test_default_display_lookup_bypasses_listing_cache(macloop_module, monkeypatch) -> None:
+    displays = [{"id": 101, "name": "Display 101", "width": 2560, "height": 1440, "is_default": True}]
+    monkeypatch.setattr(macloop_module, "_list_displays", lambda: list(displays))
+
+    assert macloop_module.SystemAudioSource.list_displays()[0]["id"] == 101
+    displays[0] = {"id": 202, "name": "Display 202", "width": 1920, "height": 1080, "is_default": True}
+
+    resolve = macloop_module.SystemAudioSource._resolve_backend_spec_kwargs
+    assert resolve() == ("system_audio", {"display_id": 202})
+
+
 def test_stats_passthrough(macloop_module) -> None:
     with macloop_module.AudioEngine() as engine:
         stats = engine.stats()
@@ -256,6 +304,185 @@ def test_wav_sink_close_releases_routes_on_backend_error(macloop_module, tmp_pat
         assert sink._closed is True
 
 
+def test_asr_sink_ignores_chunks_delivered_after_close(macloop_module) -> None:
+    with macloop_module.AudioEngine() as engine:
+        stream = engine.create_stream(macloop_module.MicrophoneSource)
+        route = engine.route(stream=stream)
+        sink = macloop_module.AsrSink(
+            routes=[route],
+            chunk_frames=2,
+            sample_rate=16000,
+            channels=1,
+            sample_format="f32",
+        )
+        sink.close()
+
+        sink._on_chunk(route.id, 2, np.zeros(2, dtype=np.float32))
+
+        chunks = list(sink.chunks())
+        assert [chunk.samples.tolist() for chunk in chunks] == [
+            pytest.approx([0.1, 0.2]),
+            pytest.approx([0.3, 0.4]),
+        ]
+        assert sink._queue.drain() == []
+
+
+def test_asr_sink_coalesces_async_wakeups_per_burst(macloop_module) -> None:
+    async def consume() -> tuple[int, list[float], object]:
+        with macloop_module.AudioEngine() as engine:
+            stream = engine.create_stream(macloop_module.MicrophoneSource)
+            route = engine.route(stream=stream)
+            sink = macloop_module.AsrSink(
+                routes=[route],
+                chunk_frames=2,
+                sample_rate=16000,
+                channels=1,
+                sample_format="f32",
+            )
+            chunks = sink.chunks_async()
+            emitted = [await anext(chunks), await anext(chunks)]
+
+            wakeup = sink._async_wakeup
+            notified = 0
+            original_notify = wakeup.notify
+
+            def counting_notify() -> None:
+                nonlocal notified
+                notified += 1
+                original_notify()
+
+            wakeup.notify = counting_notify
+            try:
+                for value in (0.5, 0.6, 0.7):
+                    sink._on_chunk(route.id, 1, np.array([value], dtype=np.float32))
+                burst = [await anext(chunks) for _ in range(3)]
+            finally:
+                sink.close()
+
+            values = [float(chunk.samples[0]) for chunk in [*emitted, *burst]]
+            return notified, values, sink._async_wakeup
+
+    notified, values, wakeup_after_close = asyncio.run(consume())
+    assert notified == 1
+    assert values == pytest.approx([0.1, 0.3, 0.5, 0.6, 0.7])
+    assert wakeup_after_close is None
+
+
+def test_asr_sink_async_close_from_another_thread_stops_iteration(macloop_module) -> None:
+    async def consume() -> tuple[int, object]:
+        with macloop_module.AudioEngine() as engine:
+            stream = engine.create_stream(macloop_module.MicrophoneSource)
+            route = engine.route(stream=stream)
+            sink = macloop_module.AsrSink(
+                routes=[route],
+                chunk_frames=2,
+                sample_rate=16000,
+                channels=1,
+                sample_format="f32",
+            )
+            received = 0
+            closer = threading.Timer(0.05, sink.close)
+            closer.start()
+            async for _ in sink:
+                received += 1
+            closer.join()
+            return received, sink._async_wakeup
+
+    received, wakeup_after_close = asyncio.run(asyncio.wait_for(consume(), timeout=2.0))
+    assert received == 2
+    assert wakeup_after_close is None
+
+
+def test_asr_sink_async_mode_stays_unbound_when_add_reader_fails(macloop_module, monkeypatch) -> None:
+    opened: list[int] = []
+    real_pipe = os.pipe
+
+    def tracking_pipe() -> tuple[int, int]:
+        fds = real_pipe()
+        opened.extend(fds)
+        return fds
+
+    monkeypatch.setattr(macloop_module.os, "pipe", tracking_pipe)
+
+    async def activate_async_mode(sink) -> None:
+        loop = asyncio.get_running_loop()
+
+        def unsupported_add_reader(*_args) -> None:
+            raise NotImplementedError
+
+        monkeypatch.setattr(loop, "add_reader", unsupported_add_reader)
+        with pytest.raises(NotImplementedError):
+            sink._activate_async_mode()
+        assert len(opened) == 2
+        for fd in opened:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+
+    with macloop_module.AudioEngine() as engine:
+        stream = engine.create_stream(macloop_module.MicrophoneSource)
+        route = engine.route(stream=stream)
+        sink = macloop_module.AsrSink(
+            routes=[route],
+            chunk_frames=2,
+            sample_rate=16000,
+            channels=1,
+            sample_format="f32",
+        )
+        try:
+            asyncio.run(activate_async_mode(sink))
+            assert sink._async_loop is None
+            assert sink._async_queue is None
+            assert sink._async_wakeup is None
+        finally:
+            sink.close()
+
+
+def test_asr_sink_close_releases_wakeup_pipe_of_idle_loop(macloop_module) -> None:
+    async def activate_async_mode(sink) -> None:
+        sink._activate_async_mode()
+
+    def make_sink(engine):
+        stream = engine.create_stream(macloop_module.MicrophoneSource)
+        route = engine.route(stream=stream)
+        return macloop_module.AsrSink(
+            routes=[route],
+            chunk_frames=2,
+            sample_rate=16000,
+            channels=1,
+            sample_format="f32",
+        )
+
+    def assert_closed(fds: tuple[int, int]) -> None:
+        for fd in fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+
+    with macloop_module.AudioEngine() as engine:
+        loop = asyncio.new_event_loop()
+        sink = make_sink(engine)
+        loop.run_until_complete(activate_async_mode(sink))
+        wakeup = sink._async_wakeup
+        fds = (wakeup._read_fd, wakeup._write_fd)
+        sink.close()
+        loop.close()
+        assert sink._async_wakeup is None
+        assert_closed(fds)
+
+        loop = asyncio.new_event_loop()
+        sink = make_sink(engine)
+        loop.run_until_complete(activate_async_mode(sink))
+        wakeup = sink._async_wakeup
+        fds = (wakeup._read_fd, wakeup._write_fd)
+        loop.is_running = lambda: True
+        sink.close()
+        del loop.is_running
+        loop.close()
+        assert sink._async_wakeup is wakeup
+        sink.close()
+        assert sink._async_wakeup is None
+        assert_closed(fds)
+
+
 def test_asr_sink_rejects_different_asyncio_event_loop(macloop_module) -> None:
     async def activate_async_mode(sink) -> None:
         sink._activate_async_mode()